@@ -4,11 +4,180 @@ Generates GIFs for different sections of the blog with configurable parameters.
 """
 
 from manim import *
+from manim import __version__ as manim_version
+import numpy as np
 import argparse
+import functools
+import hashlib
+import importlib
 import json
+import math
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from multiprocessing import Pool
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional, Tuple
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib decoder
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional, large configs are then loaded whole
+    ijson = None
+
+# Render subprocesses run from the script's own directory
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+# manim subprocesses build their scene from the JSON config file named in this variable
+_CONFIG_ENV_VAR = "MASTERMIND_ANIMATION_CONFIG"
+
+# Configs above this size are streamed so only the keys a scene reads are kept
+_STREAMED_CONFIG_SIZE = 1 << 20
+
+# Shaped code blocks are pickled here, so they survive between runs
+_CODE_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "grok-mastermind"
+
+# Tex and Text SVGs are cached here, so every render process shares them
+_SHARED_CACHE_DIR = Path(tempfile.gettempdir()) / "mastermind_animations_cache"
+_SHARED_CACHE_CONFIG = MappingProxyType({
+    'tex_dir': str(_SHARED_CACHE_DIR / "Tex"),
+    'text_dir': str(_SHARED_CACHE_DIR / "texts"),
+})
+
+# Render settings shared by in-process and subprocess renders. manim already streams
+# frames to ffmpeg from a writer thread; keep enough partial movie files cached that
+# scenes with many plays don't evict their own partials mid-render
+_RENDER_CONFIG = MappingProxyType({
+    'max_files_cached': 1000,
+})
+
+
+@njit(cache=True)
+def rorb(value, count):
+    """Rotate the low byte of a 32-bit register value right by `count` bits."""
+    low_byte = value & 0xFF
+    rotated = (low_byte >> count) | ((low_byte << (8 - count)) & 0xFF)
+    return (value & ~0xFF) | rotated
+
+
+@njit(cache=True)
+def rorl8(value):
+    """Rotate a 32-bit register value by a whole byte, moving the top byte to the bottom."""
+    return ((value << 8) & 0xFFFFFFFF) | (value >> 24)
+
+
+@njit(cache=True)
+def pack_trace(value, rounds, count):
+    """Trace the rorb/rorl packing loop.
+
+    Returns the register value after each instruction: the rorb result of
+    round k at index 2k and the rorl result at index 2k + 1.
+    """
+    out = np.empty(2 * rounds, np.int64)
+    for k in range(rounds):
+        value = rorb(value, count)
+        out[2 * k] = value
+        value = rorl8(value)
+        out[2 * k + 1] = value
+    return out
+
+
+def extract_bits(value, bits):
+    """Return the lowest `bits` bits of `value`, least significant first."""
+    raw = np.frombuffer((int(value) & ((1 << bits) - 1)).to_bytes((bits + 7) // 8, 'little'), dtype=np.uint8)
+    return np.unpackbits(raw, bitorder='little')[:bits]
+
+
+class DotGrid(PMobject):
+    """
+    A grid of dots stored as a single point cloud.
+    Each dot is one point with its own RGBA row, so fading or dropping dots
+    is an array slice instead of a per-Mobject animation.
+    """
+
+    def __init__(self, rows: int, cols: int, spacing: float, dot_size: float,
+                 color: str = BLUE, background_color: str = BLACK,
+                 seed: Optional[int] = None, **kwargs):
+        # The Cairo camera overwrites pixels with point colors instead of
+        # blending them, so fading means moving towards the background color
+        self.background_color = background_color
+        # Each point is drawn as a square of stroke_width pixels
+        stroke_width = max(1, round(dot_size * config.pixel_width / config.frame_width))
+        super().__init__(stroke_width=stroke_width, **kwargs)
+
+        row_index, col_index = np.divmod(np.arange(rows * cols), cols)
+        points = np.zeros((rows * cols, 3))
+        points[:, 0] = (col_index - (cols - 1) / 2) * spacing
+        points[:, 1] = ((rows - 1) / 2 - row_index) * spacing
+        # Store dots in shuffled order, so slicing off the leading dots
+        # eliminates possibilities scattered across the grid
+        order = np.random.default_rng(seed).permutation(len(points))
+        self.add_points(points[order], color=color)
+
+    def fade(self, darkness: float = 0.5, family: bool = True) -> "DotGrid":
+        return self.fade_to(self.background_color, darkness, family)
+
+    def fade_out_leading(self, count: int) -> Animation:
+        """Animate the first `count` dots blending into the background."""
+        start = self.rgbas[:count].copy()
+        offset = color_to_rgba(self.background_color) - start
+
+        def update_opacity(grid, alpha):
+            # Only the faded slice is written, in place; the rest of the cloud is untouched
+            np.add(start, alpha * offset, out=grid.rgbas[:count])
+
+        return UpdateFromAlphaFunc(self, update_opacity)
+
+    def drop_leading(self, count: int) -> "DotGrid":
+        """Remove the first `count` dots from the cloud."""
+        self.points = self.points[count:]
+        self.rgbas = self.rgbas[count:]
+        return self
+
+
+# Text color the Text/Tex defaults were last configured with, if any
+_defaults_text_color: Optional[str] = None
+
+
+def _configure_defaults(text_color) -> None:
+    """Set the Text/Tex defaults, only touching them when the color changes."""
+    global _defaults_text_color
+    color = ManimColor(text_color).to_hex()
+    if color == _defaults_text_color:
+        return
+    # Most strings are shaped once, so skip the SVG cache and the deep copy
+    # it makes of every new Text
+    Text.set_default(color=text_color, use_svg_cache=False)
+    Tex.set_default(color=text_color)
+    _defaults_text_color = color
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_text(text: str, font_size: float, color: str) -> Text:
+    """Shape a Text once per (text, font size, color).
+
+    The returned Text is shared, so never mutate it; copy it instead.
+    """
+    return Text(text, font_size=font_size, color=color)
+
 
 class BaseAnimation(Scene):
     """
@@ -18,7 +187,17 @@ class BaseAnimation(Scene):
 
     def __init__(self, config: Dict[str, Any] = None, **kwargs):
         super().__init__(**kwargs)
+        if config is None and os.environ.get(_CONFIG_ENV_VAR):
+            # Built by the manim CLI in a render subprocess, so read the parent's config file
+            config = read_config(Path(os.environ[_CONFIG_ENV_VAR]), type(self))
         self.config = config or self.get_default_config()
+        self._hex_glyphs: Dict[Tuple[str, float], Text] = {}
+        self._code_lines: Dict[Tuple[int, int], Tuple[Mobject, ManimColor]] = {}
+
+    @classmethod
+    def required_config_keys(cls) -> frozenset:
+        """Return the config keys this animation reads."""
+        return frozenset(cls.get_default_config())
 
     @classmethod
     def get_default_config(cls) -> Dict[str, Any]:
@@ -35,6 +214,7 @@ class BaseAnimation(Scene):
             'font_size': 36,
             'animation_speed': 1.0,
             'wait_time': 1.0,
+            'hex_font_sizes': [],  # Font sizes of hex values to pre-shape, per scene
         }
 
     def setup_scene(self):
@@ -42,44 +222,172 @@ class BaseAnimation(Scene):
         # Set background color
         self.camera.background_color = self.config['background_color']
 
-        # Configure text defaults
-        Text.set_default(color=self.config['text_color'])
-        Tex.set_default(color=self.config['text_color'])
+        # Configure text defaults once per process (and text color)
+        _configure_defaults(self.config['text_color'])
+
+        # Shape every hex glyph once, so hex values are assembled from copies
+        for font_size in self.config.get('hex_font_sizes', []):
+            for char in "0123456789ABCDEFx":
+                self._hex_glyph(char, font_size)
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _register_prototype(cls, register_name: str, width: float, height: float, color: str,
+                            font_size: float, text_color: str) -> Tuple[Rectangle, Text, Text]:
+        """Build the register Mobjects once per parameter set.
+
+        The returned prototypes are shared, so never mutate them; copy them instead.
+        """
+        reg_rect = Rectangle(width=width, height=height, color=color)
+        reg_label = Text(register_name, font_size=font_size * 0.8, color=text_color).next_to(reg_rect, UP)
+        reg_value = Text("", font_size=font_size * 0.6, color=text_color).move_to(reg_rect)
+
+        return reg_rect, reg_label, reg_value
 
     def create_register_visualization(self, register_name: str, width: float = 4,
                                    height: float = 0.8, color: str = BLUE) -> Tuple[Rectangle, Text, Text]:
         """Create a visual representation of a CPU register."""
-        reg_rect = Rectangle(width=width, height=height, color=color)
-        reg_label = Text(register_name, font_size=self.config['font_size'] * 0.8).next_to(reg_rect, UP)
-        reg_value = Text("", font_size=self.config['font_size'] * 0.6).move_to(reg_rect)
+        prototypes = self._register_prototype(register_name, width, height, color,
+                                              self.config['font_size'], self.config['text_color'])
+        return tuple(mob.copy() for mob in prototypes)
 
-        return reg_rect, reg_label, reg_value
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def _code_block_prototype(cls, code_lines: Tuple[str, ...], font_size: float, color: str) -> VGroup:
+        """Shape code lines once per parameter set.
+
+        The returned prototype is shared, so never mutate it; copy it instead.
+        Blocks are also pickled to disk, so later runs skip shaping them.
+        """
+        key = hashlib.sha256(repr((code_lines, font_size, color, manim_version)).encode()).hexdigest()
+        cache_file = _CODE_CACHE_DIR / f"code_{key}.pkl"
+        if cache_file.exists():
+            try:
+                with cache_file.open('rb') as f:
+                    return pickle.load(f)
+            except Exception:
+                pass  # Unreadable or corrupt cache entry, shape the block again and overwrite it
+
+        # Without ligatures Text keeps one submobject per character, newlines included
+        text = Text("\n".join(code_lines), font_size=font_size, font="Monospace",
+                    color=color, disable_ligatures=True)
+        line_starts = np.cumsum([0] + [len(line) + 1 for line in code_lines])
+        block = VGroup(*[
+            VGroup(*text.submobjects[start:start + len(line)])
+            for start, line in zip(line_starts, code_lines)
+        ])
+
+        # Write to a private file first, so parallel renders never read a partial pickle
+        partial_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            _CODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with partial_file.open('wb') as f:
+                pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial_file, cache_file)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # The cache is only an optimization, so a block that can't be stored is just returned
+            partial_file.unlink(missing_ok=True)
+        return block
+
+    def create_code_block(self, code_lines: List[str], font_size: float = 16) -> VGroup:
+        """Shape code lines as a single Text and group its glyphs per line."""
+        color = ManimColor(self.config['text_color']).to_hex()
+        return self._code_block_prototype(tuple(code_lines), font_size, color).copy()
+
+    def _get_code_line(self, code_obj, line_index: int) -> Optional[Tuple[Mobject, ManimColor]]:
+        """Return a live line of a code object with its original color, cached per line."""
+        key = (id(code_obj), line_index)
+        if key not in self._code_lines:
+            if hasattr(code_obj, 'submobjects') and code_obj.submobjects:
+                # For VGroup of Text objects
+                lines = code_obj.submobjects
+            elif hasattr(code_obj, 'code'):
+                # For Code objects (fallback)
+                lines = [line[0] for line in code_obj.code]
+            else:
+                lines = []
+            if line_index >= len(lines):
+                return None
+            line = lines[line_index]
+            # A line's VGroup always reports WHITE, so take the color from its first glyph
+            orig_color = (line[0].get_color() if line.submobjects
+                          else ManimColor(self.config['text_color']))
+            self._code_lines[key] = (line, orig_color)
+        return self._code_lines[key]
 
     def animate_code_highlight(self, code_obj, line_index: int,
-                             highlight_color: str = None) -> Animation:
-        """Highlight a specific line of code."""
+                             highlight_color: str = None, restore: bool = True) -> Animation:
+        """Highlight a specific line of code, restoring its color afterwards if requested."""
         highlight_color = highlight_color or self.config['highlight_color']
-        if hasattr(code_obj, 'submobjects') and line_index < len(code_obj.submobjects):
-            # For VGroup of Text objects
-            line = code_obj.submobjects[line_index].copy()
-            return line.animate.set_color(highlight_color)
-        elif hasattr(code_obj, 'code') and line_index < len(code_obj.code):
-            # For Code objects (fallback)
-            line = code_obj.code[line_index][0].copy()
-            return line.animate.set_color(highlight_color)
+        code_line = self._get_code_line(code_obj, line_index)
+        if code_line is not None:
+            # The line is animated in place, so no copy of its glyphs is made. Each step is
+            # built right away, since every .animate of the line replaces its shared target
+            line, orig_color = code_line
+            highlight = line.animate.set_color(highlight_color).build()
+            if restore:
+                return Succession(highlight, line.animate.set_color(orig_color).build())
+            return highlight
         return Wait(0.1)
 
     def create_bit_visualization(self, value: int, bits: int = 32,
                                spacing: float = 0.1) -> VGroup:
         """Create a visual representation of bits in a register."""
-        bit_squares = VGroup()
-        for i in range(bits):
-            bit = (value >> i) & 1
-            color = GREEN if bit else GRAY
-            square = Square(side_length=0.3, color=color, fill_opacity=0.7)
-            square.shift(RIGHT * (i - bits/2) * (square.side_length + spacing))
-            bit_squares.add(square)
-        return bit_squares
+        side_length = 0.3
+        # Extract every bit up front and lay out every center in one vectorized pass
+        bit_values = extract_bits(value, bits)
+        centers = np.zeros((bits, 3))
+        centers[:, 0] = (np.arange(bits) - bits/2) * (side_length + spacing)
+
+        return VGroup(*[
+            Square(side_length=side_length, color=GREEN if bit else GRAY,
+                   fill_opacity=0.7).move_to(center)
+            for bit, center in zip(bit_values, centers)
+        ])
+
+    def _hex_glyph(self, char: str, font_size: float) -> Text:
+        """Return the cached glyph for a single hex character."""
+        key = (char, font_size)
+        if key not in self._hex_glyphs:
+            # Glyphs are reused across scenes, so they keep the SVG cache
+            self._hex_glyphs[key] = Text(char, font_size=font_size, font="Monospace",
+                                         use_svg_cache=True)
+        return self._hex_glyphs[key]
+
+    def hex_text(self, value: int, width: int = 8, font_size: float = 24) -> VGroup:
+        """Assemble a "0x..." hex string from copies of the cached glyphs."""
+        return VGroup(*[
+            self._hex_glyph(char, font_size).copy()
+            for char in f"0x{value:0{width}X}"
+        ]).arrange(RIGHT, buff=0.02, aligned_edge=DOWN)
+
+    def create_hex_display(self, tracker: ValueTracker, digits: int = 8,
+                           font_size: float = 24) -> VGroup:
+        """Create a "0x..." readout that follows the value of a tracker.
+
+        Each digit is a preallocated glyph that only swaps to a cached glyph
+        when its nibble changes, so no new Text is shaped during playback.
+        """
+        value = int(tracker.get_value())
+        display = self.hex_text(value, digits, font_size)
+
+        for i in range(digits):
+            shift = 4 * (digits - 1 - i)
+            nibble = (value >> shift) & 0xF
+            slot = display[2 + i]
+            slot.nibble = nibble
+
+            def update_digit(slot, shift=shift):
+                nibble = (int(tracker.get_value()) >> shift) & 0xF
+                if nibble != slot.nibble:
+                    color = slot.get_color()
+                    slot.become(self._hex_glyph(f"{nibble:X}", font_size), match_center=True)
+                    slot.set_color(color)
+                    slot.nibble = nibble
+
+            slot.add_updater(update_digit)
+
+        return display
 
     def animate_bit_change(self, bit_squares: VGroup, bit_index: int,
                           new_value: int, color: str = None) -> Animation:
@@ -87,6 +395,12 @@ class BaseAnimation(Scene):
         color = color or (GREEN if new_value else GRAY)
         return bit_squares[bit_index].animate.set_color(color)
 
+    def text(self, text: str, font_size: float = None, color: str = None) -> Text:
+        """Return a copy of a cached Text, for strings that are shown repeatedly."""
+        font_size = font_size or self.config['font_size']
+        color = ManimColor(color or self.config['text_color']).to_hex()
+        return _cached_text(text, font_size, color).copy()
+
     def add_title_and_wait(self, title_text: str, wait_time: float = None):
         """Add a title to the scene and wait."""
         wait_time = wait_time or self.config['wait_time']
@@ -107,6 +421,8 @@ class BaseAnimation(Scene):
 class RegisterPackingExecution(BaseAnimation):
     """Animation showing register packing execution with rorb/rorl instructions."""
 
+    _CODE_LINES = ("rorb %cl, %bl", "rorl $8, %ebx")
+
     @classmethod
     def get_default_config(cls) -> Dict[str, Any]:
         config = super().get_default_config()
@@ -116,6 +432,7 @@ class RegisterPackingExecution(BaseAnimation):
             'initial_mask': 0b10000000100000001000000010000000,
             'register_width': 4,
             'bit_animation_delay': 0.5,
+            'hex_font_sizes': [24],
         })
         return config
 
@@ -126,43 +443,51 @@ class RegisterPackingExecution(BaseAnimation):
 
         # Create register visualization
         ebx_rect, ebx_label, ebx_value = self.create_register_visualization("%ebx")
-        ebx_value_text = Text(f"0x{self.config['initial_mask']:08X}", font_size=24)
+        self.value_tracker = ValueTracker(self.config['initial_mask'])
+        ebx_value_text = self.create_hex_display(self.value_tracker, font_size=24)
         ebx_value_text.move_to(ebx_rect)
 
         # Simple assembly code display
-        code_text = Text("rorb %cl, %bl\nrorl $8, %ebx", font_size=20, font="Monospace")
+        code_text = self.create_code_block(self._CODE_LINES, font_size=20)
         code_text.to_corner(UL)
 
         self.play(Create(ebx_rect), Write(ebx_label), Write(ebx_value_text), Write(code_text))
 
-        current_value = self.config['initial_mask']
+        # Trace every register state of the loop in one call:
+        # rorb %cl, %bl rotates the bottom byte right by cl positions,
+        # rorl $8, %ebx rotates the entire register left by 8 bits
+        trace = pack_trace(self.config['initial_mask'], 4, 3)
 
+        # Build every iteration upfront and play them as one timeline
+        iterations = []
         for i in range(4):
-            # Simple highlight effect
-            self.play(code_text.animate.set_color(YELLOW), run_time=0.8)
-
-            # Animate bit rotation
-            # rorb %cl, %bl - rotate bottom byte right by cl positions
-            rotated_byte = ((current_value & 0xFF) >> 3) | (((current_value & 0xFF) << 5) & 0xFF)
-            new_value = (current_value & ~0xFF) | rotated_byte
-
-            # Update display
-            new_value_text = Text(f"0x{new_value:08X}", font_size=24, color=GREEN)
-            new_value_text.move_to(ebx_rect)
-            self.play(Transform(ebx_value_text, new_value_text), run_time=self.config['bit_animation_delay'])
-
-            # Reset code color
-            self.play(code_text.animate.set_color(WHITE), run_time=0.8)
-
-            # rorl $8, %ebx - rotate entire register left by 8 bits
-            new_value = ((new_value << 8) & 0xFFFFFFFF) | (new_value >> 24)
-            current_value = new_value
-
-            # Update display with shift animation
-            final_value_text = Text(f"0x{current_value:08X}", font_size=24)
-            final_value_text.move_to(ebx_rect)
-            self.play(Transform(ebx_value_text, final_value_text),
-                     run_time=0.5)
+            new_value = int(trace[2 * i])
+            current_value = int(trace[2 * i + 1])
+
+            # The groups would suspend the readout's digit updaters, so they are told not to;
+            # the readout then follows the tracker while UpdateFromFunc recolors it
+            iterations.append(Succession(
+                # Highlight the rorb line
+                self.animate_code_highlight(code_text, 0).set_run_time(0.8),
+                # Update display
+                AnimationGroup(
+                    self.value_tracker.animate.set_value(new_value),
+                    UpdateFromFunc(ebx_value_text, lambda m: m.set_color(GREEN)),
+                    run_time=self.config['bit_animation_delay'],
+                    suspend_mobject_updating=False,
+                ),
+                # Highlight the rorl line
+                self.animate_code_highlight(code_text, 1).set_run_time(0.8),
+                # Update display with shift animation
+                AnimationGroup(
+                    self.value_tracker.animate.set_value(current_value),
+                    UpdateFromFunc(ebx_value_text, lambda m: m.set_color(self.config['text_color'])),
+                    run_time=0.5,
+                    suspend_mobject_updating=False,
+                ),
+            ))
+
+        self.play(Succession(*iterations))
 
         # Final message
         final_msg = Text("Full combination packed!", font_size=30, color=GREEN).next_to(ebx_rect, DOWN)
@@ -192,13 +517,16 @@ class RegisterPackingVisual(Scene):
         byte_squares = VGroup()
         byte_labels = VGroup()
 
+        # Build one byte of 8 bit squares and copy it for the other bytes
+        byte_prototype = VGroup(*[
+            Square(side_length=0.35, fill_opacity=0.2, stroke_width=1)
+            .move_to(register_frame.get_center() + RIGHT * bit * 0.38)
+            for bit in range(8)
+        ])
+
         for byte_idx in range(4):
             start_x = -5.4 + byte_idx * 3
-            byte_group = VGroup()
-            for bit in range(8):
-                sq = Square(side_length=0.35, color=byte_colors[byte_idx], fill_opacity=0.2, stroke_width=1)
-                sq.move_to(register_frame.get_center() + RIGHT * (start_x + bit * 0.38))
-                byte_group.add(sq)
+            byte_group = byte_prototype.copy().set_color(byte_colors[byte_idx]).shift(RIGHT * start_x)
             byte_squares.add(byte_group)
 
             b_label = Tex(f"Byte {3 - byte_idx}").scale(0.6)
@@ -223,10 +551,15 @@ class RegisterPackingVisual(Scene):
         # Create legend with padded symbol names for alignment
         padded_symbols = ["SKOCKO  ", "TREF    ", "PIK     ", "HERC    ", "KARO    ", "ZVEZDA  "]
 
+        # Only the names get highlighted; patterns keep their legend color
+        legend_names = []
         for sym, pat, col in zip(padded_symbols, patterns, legend_colors):
+            name_tex = Tex(sym).scale(0.55)
             pat_tex = Tex(pat).scale(0.55).set_color(col)
-            row = VGroup(Tex(sym).scale(0.55), pat_tex).arrange(RIGHT, buff=0.3)
+            row = VGroup(name_tex, pat_tex).arrange(RIGHT, buff=0.3)
             legend.add(row)
+            legend_names.append(name_tex)
+        name_color = legend_names[0].get_color()
 
         legend.arrange(DOWN, aligned_edge=LEFT, buff=0.35).next_to(legend_title, DOWN, buff=0.3)
         self.play(Write(legend))
@@ -244,8 +577,8 @@ class RegisterPackingVisual(Scene):
 
         for step, (sym, sym_idx, pattern) in enumerate(zip(combo, combo_indices, final_patterns)):
             # Highlight legend
-            legend_row = legend[sym_idx + 1]
-            self.play(legend_row.animate.set_color(YELLOW))
+            legend_name = legend_names[sym_idx]
+            self.play(legend_name.animate.set_color(YELLOW))
 
             # Always load into byte 0 (rightmost byte)
             target_byte = 3  # Always byte 0 (rightmost in our visualization)
@@ -255,11 +588,12 @@ class RegisterPackingVisual(Scene):
             self.play(ReplacementTransform(current_expl, load_expl))
             current_expl = load_expl
 
-            # Set the bits in byte 0 (rightmost)
+            # Set the bits in byte 0 (rightmost), filling all set bits at once
             target_byte_squares = byte_squares[target_byte]
-            for i, bit in enumerate(pattern):
-                if bit == "1":
-                    self.play(target_byte_squares[i].animate.set_fill(legend_colors[sym_idx], opacity=1), run_time=0.3)
+            set_bits = np.flatnonzero(np.frombuffer(pattern.encode(), dtype=np.uint8) == ord("1"))
+            if len(set_bits):
+                set_squares = VGroup(*[target_byte_squares[i] for i in set_bits])
+                self.play(set_squares.animate.set_fill(legend_colors[sym_idx], opacity=1), run_time=0.3)
 
             # Show rorl $8 operation - rotate left by 8 bits immediately after loading
             rorl_expl = Tex(r"rorl \$8, \%ebx - rotate entire register left by 8 bits").scale(0.65).to_edge(DOWN)
@@ -289,23 +623,27 @@ class RegisterPackingVisual(Scene):
             # After rotation: [byte2, byte1, byte0, byte3]
             temp_byte_squares = [byte_squares[1], byte_squares[2], byte_squares[3], byte_squares[0]]
 
-            # Animate the rotation
-            self.play(
-                *[byte_squares[i].animate.move_to(new_positions[i]) for i in range(4)],
-                run_time=1.5
-            )
+            # Animate the rotation by writing translated points in place,
+            # instead of building a target copy for every byte
+            squares = [sq for byte in byte_squares for sq in byte]
+            original_points = [sq.points.copy() for sq in squares]
+            offsets = [new_positions[i] - current_positions[i] for i in range(4) for _ in byte_squares[i]]
+
+            def rotate_bytes(group, alpha):
+                for sq, points, offset in zip(squares, original_points, offsets):
+                    np.add(points, alpha * offset, out=sq.points)
+
+            self.play(UpdateFromAlphaFunc(byte_squares, rotate_bytes), run_time=1.5)
 
             # Update the byte_squares reference and byte labels
             byte_squares = VGroup(*temp_byte_squares)
 
-            # Update byte labels to reflect new positions
-            for i, label in enumerate(byte_labels):
-                new_label = Tex(f"Byte {3 - i}").scale(0.6)
-                new_label.move_to(label.get_center())
-                self.play(Transform(label, new_label), run_time=0.5)
+            # Byte labels are tied to positions, not to the moving bytes, so they
+            # already read correctly; hold for the time the label update used to take
+            self.wait(0.5 * len(byte_labels))
 
             # Unhighlight legend
-            self.play(legend_row.animate.set_color(WHITE))
+            self.play(legend_name.animate.set_color(name_color))
 
         # Final result
         final_expl = Tex(r"Complete combination packed in 32-bit register!").scale(0.8).set_color(GREEN).to_edge(DOWN)
@@ -323,6 +661,7 @@ class ExactMatchExecution(BaseAnimation):
             'guess_value': 0x80A02040,  # Example guess
             'secret_value': 0x80102040,  # Example secret (3 exact matches)
             'bit_operations': ['AND', 'TEST', 'INCL', 'SHRL'],
+            'hex_font_sizes': [20],
         })
         return config
 
@@ -340,12 +679,16 @@ class ExactMatchExecution(BaseAnimation):
         secret_val = self.config['secret_value']
         result = guess_val & secret_val
 
-        calc_text = Text(f"0x{guess_val:08X} & 0x{secret_val:08X} = 0x{result:08X}", font_size=20)
+        calc_text = VGroup(
+            self.hex_text(guess_val, 8, 20), Text("&", font_size=20),
+            self.hex_text(secret_val, 8, 20), Text("=", font_size=20),
+            self.hex_text(result, 8, 20)
+        ).arrange(RIGHT, buff=0.2)
         calc_text.next_to(initial_text, DOWN)
         self.play(Write(calc_text))
 
         # Count set bits
-        bit_count = bin(result).count('1')
+        bit_count = result.bit_count()
         result_text = Text(f"Number of exact matches: {bit_count}", font_size=24, color=GREEN)
         result_text.next_to(calc_text, DOWN)
         self.play(Write(result_text))
@@ -357,6 +700,16 @@ class ExactMatchExecution(BaseAnimation):
 class EliminationLoopExecution(BaseAnimation):
     """Animation showing elimination loop execution with candidate filtering."""
 
+    _CODE_LINES = (
+        "movl sve_kombinacije(,%ecx,4), %ebx",
+        "call histogram",
+        "cmpl crveni, %esi",
+        "jne skip",
+        "movl %ebx, rezultat(,%edx,4)",
+        "incl %edx",
+        "skip:",
+    )
+
     @classmethod
     def get_default_config(cls) -> Dict[str, Any]:
         config = super().get_default_config()
@@ -366,6 +719,7 @@ class EliminationLoopExecution(BaseAnimation):
             'memory_width': 1.0,
             'memory_height': 0.5,
             'memory_spacing': 0.2,
+            'hex_font_sizes': [16],
         })
         return config
 
@@ -389,20 +743,11 @@ class EliminationLoopExecution(BaseAnimation):
         ebx_group = VGroup(ebx_rect, ebx_label, ebx_value).shift(DOWN * 1.5)
 
         # Counter for current index
-        ecx_counter = Text("0", font_size=30).next_to(ebx_group, DOWN)
+        ecx_counter = self.text("0", 30).next_to(ebx_group, DOWN)
         ecx_label = Text("%ecx (index)", font_size=20).next_to(ecx_counter, DOWN)
 
         # Assembly code
-        code_lines = [
-            "movl sve_kombinacije(,%ecx,4), %ebx",
-            "call histogram",
-            "cmpl crveni, %esi",
-            "jne skip",
-            "movl %ebx, rezultat(,%edx,4)",
-            "incl %edx",
-            "skip:"
-        ]
-        code = VGroup(*[Text(line, font_size=16, font="Monospace").align_to(code_lines[0], LEFT) for line in code_lines]).arrange(DOWN, aligned_edge=LEFT).to_edge(RIGHT)
+        code = self.create_code_block(self._CODE_LINES, font_size=16).to_edge(RIGHT)
 
         # Position elements
         memory_group = VGroup(memory_blocks, memory_label).shift(UP * 1.5)
@@ -410,56 +755,85 @@ class EliminationLoopExecution(BaseAnimation):
         self.play(Create(memory_group), Create(ebx_group), Write(ecx_counter),
                  Write(ecx_label), Write(code))
 
-        # Elimination loop
+        # Elimination loop: every candidate's outcome is known up front, so the
+        # whole loop is sequenced first and played as a single timeline
         result_index = 0
+        per_candidate = []
 
-        for i in range(self.config['num_candidates']):
-            # Load candidate from memory
-            self.play(self.animate_code_highlight(code, 0), run_time=0.5)
-
-            # Animate loading into EBX
-            candidate_copy = memory_blocks[i].copy()
-            candidate_copy.generate_target()
-            candidate_copy.target.move_to(ebx_rect).set_color(BLUE)
-            self.play(MoveToTarget(candidate_copy), run_time=0.8)
-
-            # Update EBX display
-            candidate_value = Text(f"0x{(i * 0x11111111) & 0xFFFFFFFF:08X}", font_size=16)
-            candidate_value.move_to(ebx_rect)
-            self.play(Write(candidate_value), run_time=0.5)
-
-            # Call histogram function
-            self.play(self.animate_code_highlight(code, 1), run_time=0.5)
-            histogram_call = Text("histogram()", font_size=20, color=YELLOW).to_edge(LEFT)
-            self.play(Write(histogram_call), run_time=0.8)
-            self.play(FadeOut(histogram_call), run_time=0.3)
+        # Build every per-candidate text in one batch before sequencing
+        num_candidates = self.config['num_candidates']
+        candidate_values = [
+            self.hex_text((i * 0x11111111) & 0xFFFFFFFF, 8, 16).move_to(ebx_rect)
+            for i in range(num_candidates)
+        ]
+        # One hidden readout in %ebx is morphed into each candidate's value in turn
+        value_slot = candidate_values[0].copy().set_opacity(0)
+        # One hidden probe block carries every candidate from memory into %ebx
+        probe = memory_blocks[0].copy().set_fill(opacity=0).set_stroke(opacity=0)
+
+        def show_probe_at(block):
+            return UpdateFromAlphaFunc(probe, lambda m, alpha: m.move_to(block).set_fill(
+                GREY, opacity=0.3 * alpha).set_stroke(GREY, opacity=alpha))
+
+        histogram_calls = [self.text("histogram()", 20, YELLOW).to_edge(LEFT)
+                           for _ in range(num_candidates)]
+        counter_texts = [
+            self.text(str(i), 30).move_to(ecx_counter)
+            for i in range(num_candidates + 1)
+        ]
 
-            # Compare and decide
-            self.play(self.animate_code_highlight(code, 2), run_time=0.5)
+        for i in range(num_candidates):
+            candidate_value = candidate_values[i]
+            histogram_call = histogram_calls[i]
+            new_counter = counter_texts[i + 1]
+
+            steps = [
+                # Load candidate from memory
+                AnimationGroup(self.animate_code_highlight(code, 0), show_probe_at(memory_blocks[i]),
+                               run_time=0.5),
+                # Animate loading into EBX; built now, as the cleanup below animates the same probe
+                probe.animate(run_time=0.8).move_to(ebx_rect).set_fill(BLUE, opacity=0.3)
+                .set_stroke(BLUE, opacity=1).build(),
+                # Update EBX display
+                Transform(value_slot, candidate_value, run_time=0.5),
+                # Call histogram function
+                self.animate_code_highlight(code, 1).set_run_time(0.5),
+                Write(histogram_call, run_time=0.8),
+                FadeOut(histogram_call, run_time=0.3),
+                # Compare and decide
+                self.animate_code_highlight(code, 2).set_run_time(0.5),
+            ]
 
             if i in self.config['candidates_to_keep']:
                 # Keep candidate - highlight as green and move to result area
-                self.play(self.animate_code_highlight(code, 3), run_time=0.3)  # movl to result
-                self.play(self.animate_code_highlight(code, 4), run_time=0.3)  # incl %edx
-
-                # Mark as kept
-                self.play(memory_blocks[i].animate.set_color(GREEN), run_time=0.5)
-
+                steps += [
+                    self.animate_code_highlight(code, 3).set_run_time(0.3),  # movl to result
+                    self.animate_code_highlight(code, 4).set_run_time(0.3),  # incl %edx
+                    # Mark as kept
+                    memory_blocks[i].animate(run_time=0.5).set_color(GREEN),
+                ]
                 result_index += 1
             else:
                 # Eliminate candidate
-                self.play(self.animate_code_highlight(code, 5), run_time=0.3)  # jne skip
-
-                # Fade out eliminated candidate
-                self.play(FadeOut(memory_blocks[i]), run_time=0.8)
-
-            # Update counter
-            new_counter = Text(str(i + 1), font_size=30)
-            new_counter.move_to(ecx_counter)
-            self.play(Transform(ecx_counter, new_counter), run_time=0.3)
+                steps += [
+                    self.animate_code_highlight(code, 5).set_run_time(0.3),  # jne skip
+                    # Fade out eliminated candidate
+                    FadeOut(memory_blocks[i], run_time=0.8),
+                ]
+
+            steps += [
+                # Update counter
+                Transform(ecx_counter, new_counter, run_time=0.3),
+                # Clean up candidate visualization
+                AnimationGroup(
+                    probe.animate.move_to(ebx_rect).set_fill(opacity=0).set_stroke(opacity=0).build(),
+                    FadeOut(value_slot),
+                    run_time=0.3,
+                ),
+            ]
+            per_candidate.append(Succession(*steps))
 
-            # Clean up candidate visualization
-            self.play(FadeOut(candidate_copy), FadeOut(candidate_value), run_time=0.3)
+        self.play(Succession(*per_candidate))
 
         # Final result
         final_msg = Text(f"Elimination complete! {result_index} candidates remaining",
@@ -485,6 +859,7 @@ class EntropyReduction(BaseAnimation):
             'dot_radius': 0.03,
             'dot_buff': 0.15,
             'bar_max_width': 12.0,
+            'shuffle_seed': 0,  # Fixed so every render eliminates the same dots
             'guess_descriptions': [
                 "Initial possibilities",
                 "After first guess",
@@ -507,16 +882,21 @@ class EntropyReduction(BaseAnimation):
                            font_size=28)
         self.play(Write(initial_text))
 
-        # Create grid of dots representing possibilities
-        grid = VGroup(*[
-            Dot(radius=self.config['dot_radius'], color=BLUE, fill_opacity=0.8)
-            for _ in range(self.config['initial_possibilities'])
-        ])
-        grid.arrange_in_grid(
+        # Create grid of dots representing possibilities, as one point cloud
+        grid_scale = 0.8
+        dot_diameter = 2 * self.config['dot_radius']
+        grid = DotGrid(
             rows=self.config['grid_rows'],
             cols=self.config['grid_cols'],
-            buff=self.config['dot_buff']
-        ).scale(0.8)
+            spacing=(dot_diameter + self.config['dot_buff']) * grid_scale,
+            dot_size=dot_diameter * grid_scale,
+            # Pre-blend the 0.8 fill opacity, since point clouds are drawn opaque
+            color=interpolate_color(ManimColor(BLUE), ManimColor(self.config['background_color']), 0.2),
+            background_color=self.config['background_color'],
+            seed=self.config['shuffle_seed'],
+        )
+        # Drop cells beyond the number of possibilities
+        grid.drop_leading(len(grid.points) - self.config['initial_possibilities'])
 
         self.play(FadeIn(grid), run_time=2)
         self.wait(1)
@@ -529,7 +909,7 @@ class EntropyReduction(BaseAnimation):
             entropy = self.config['entropy_bits'][i]
 
             # Calculate how many dots to remove
-            dots_to_remove = len(grid) - remaining
+            dots_to_remove = len(grid.points) - remaining
 
             # Create new text and entropy bar
             new_text = Text(f"{self.config['guess_descriptions'][i]}: {remaining} left ≈ {entropy:.2f} bits",
@@ -551,16 +931,16 @@ class EntropyReduction(BaseAnimation):
             animations = [FadeOut(current_text)]
 
             if dots_to_remove > 0:
-                # Remove dots representing eliminated possibilities
-                animations.append(FadeOut(grid[:dots_to_remove], run_time=1.5))
-
-                # Update grid to only show remaining dots
-                remaining_grid = grid[dots_to_remove:].copy()
-                grid = remaining_grid
+                # Fade out dots representing eliminated possibilities
+                animations.append(grid.fade_out_leading(dots_to_remove))
 
             animations.append(FadeIn(bar_group))
 
             self.play(*animations, run_time=1.5)
+
+            # Update grid to only hold remaining dots
+            if dots_to_remove > 0:
+                grid.drop_leading(dots_to_remove)
             self.wait(0.8)
 
             current_text = new_text
@@ -578,6 +958,13 @@ class EntropyReduction(BaseAnimation):
 class StackOverwriteExecution(BaseAnimation):
     """Animation showing stack overwrite execution for printf display."""
 
+    _CODE_LINES = (
+        "subl %eax, %esp     # skip empty slots",
+        "pushl $znak_zuti    # push yellow peg",
+        "pushl $znak_crveni   # push red peg",
+        "pushl $znak_plavi    # push blue peg",
+    )
+
     @classmethod
     def get_default_config(cls) -> Dict[str, Any]:
         config = super().get_default_config()
@@ -611,7 +998,7 @@ class StackOverwriteExecution(BaseAnimation):
                 color=GREY,
                 fill_opacity=0.2
             )
-            label = Text("empty", font_size=16)
+            label = self.text("empty", 16)
             label.move_to(slot)
             stack_slots.append(VGroup(slot, label))
 
@@ -627,26 +1014,23 @@ class StackOverwriteExecution(BaseAnimation):
         esp_label = Text("%esp →", font_size=20).next_to(esp_arrow, LEFT)
 
         # Assembly code
-        code_lines = [
-            "subl %eax, %esp     # skip empty slots",
-            "pushl $znak_zuti    # push yellow peg",
-            "pushl $znak_crveni   # push red peg",
-            "pushl $znak_plavi    # push blue peg"
-        ]
-        code = VGroup(*[Text(line, font_size=16, font="Monospace").align_to(code_lines[0], LEFT) for line in code_lines]).arrange(DOWN, aligned_edge=LEFT).to_edge(RIGHT)
+        code = self.create_code_block(self._CODE_LINES, font_size=16).to_edge(RIGHT)
 
         # Initial setup
         self.play(Create(stack), Create(esp_arrow), Write(esp_label), Write(code))
 
+        # Both ESP Mobjects follow a single slot tracker instead of being shifted separately
+        row_height = self.config['stack_height'] + self.config['stack_buff']
+        self._esp_slot = ValueTracker(0.0)
+        base_arrow_pos = esp_arrow.get_center().copy()
+        base_label_pos = esp_label.get_center().copy()
+        esp_arrow.add_updater(lambda m: m.move_to(base_arrow_pos + DOWN * self._esp_slot.get_value() * row_height))
+        esp_label.add_updater(lambda m: m.move_to(base_label_pos + DOWN * self._esp_slot.get_value() * row_height))
+
         # Skip empty slots with subl
         self.play(self.animate_code_highlight(code, 0), run_time=0.8)
 
-        skip_distance = self.config['skip_slots'] * (self.config['stack_height'] + self.config['stack_buff'])
-        self.play(
-            esp_arrow.animate.shift(DOWN * skip_distance),
-            esp_label.animate.shift(DOWN * skip_distance),
-            run_time=1.5
-        )
+        self.play(self._esp_slot.animate.set_value(self.config['skip_slots']), run_time=1.5)
 
         # Push symbols onto stack
         current_stack_top = self.config['skip_slots']
@@ -668,11 +1052,7 @@ class StackOverwriteExecution(BaseAnimation):
             )
 
             # Move ESP up for push
-            self.play(
-                esp_arrow.animate.shift(UP * (self.config['stack_height'] + self.config['stack_buff'])),
-                esp_label.animate.shift(UP * (self.config['stack_height'] + self.config['stack_buff'])),
-                run_time=0.5
-            )
+            self.play(self._esp_slot.animate.set_value(self._esp_slot.get_value() - 1), run_time=0.5)
 
         # Final message
         final_msg = Text("Only needed slots updated! Stack optimized.",
@@ -686,6 +1066,19 @@ class StackOverwriteExecution(BaseAnimation):
 class BenchmarkChart(BaseAnimation):
     """Animation showing benchmark comparison between Assembly and C versions."""
 
+    # Run times of the animated build-up, in order; the static path holds for their total
+    _BUILD_UP_RUN_TIMES = MappingProxyType({
+        'axes': 1.0,
+        'assembly_bar': 1.0,
+        'assembly_labels': 1.0,
+        'c_bar': 1.0,
+        'c_labels': 1.0,
+        'comparison': 2.0,
+        'comparison_hold': 2.0,
+        'optimization_note': 1.0,
+        'optimization_note_hold': 2.0,
+    })
+
     @classmethod
     def get_default_config(cls) -> Dict[str, Any]:
         config = super().get_default_config()
@@ -700,25 +1093,46 @@ class BenchmarkChart(BaseAnimation):
             'c_color': RED,
             'axis_color': BLUE,
             'show_percentage': True,
+            'static_fast': False,  # Show the finished chart as a still instead of building it up
         })
         return config
 
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def _axes_prototype(cls, x_range: Tuple[float, ...], y_range: Tuple[float, ...],
+                        x_length: float, y_length: float, axis_color: str,
+                        text_color: str) -> Tuple[Axes, Text, Text]:
+        """Build the chart axes and axis labels once per shape, for parameter sweeps.
+
+        The returned prototypes are shared, so never mutate them; copy them instead.
+        """
+        axes = Axes(
+            x_range=list(x_range),
+            y_range=list(y_range),
+            axis_config={"color": axis_color},
+            x_length=x_length,
+            y_length=y_length
+        )
+
+        x_label = Text("Implementation", font_size=24, color=text_color).next_to(axes.x_axis, DOWN)
+        y_label = Text("Time (ms)", font_size=24, color=text_color).next_to(axes.y_axis, LEFT).rotate(90 * DEGREES)
+
+        return axes, x_label, y_label
+
     def construct(self):
         self.setup_scene()
 
         title = self.add_title_and_wait("Benchmark: Assembly vs C Performance")
 
         # Create axes
-        axes = Axes(
-            x_range=[0, 3, 1],
-            y_range=[0, self.config['max_time'], 2],
-            axis_config={"color": self.config['axis_color']},
-            x_length=6,
-            y_length=self.config['chart_height']
-        )
-
-        x_label = Text("Implementation", font_size=24).next_to(axes.x_axis, DOWN)
-        y_label = Text("Time (ms)", font_size=24).next_to(axes.y_axis, LEFT).rotate(90 * DEGREES)
+        axes, x_label, y_label = (mob.copy() for mob in self._axes_prototype(
+            (0, 3, 1),
+            (0, self.config['max_time'], 2),
+            6,
+            self.config['chart_height'],
+            self.config['axis_color'],
+            self.config['text_color']
+        ))
 
         # Create bars
         assembly_height = (self.config['assembly_time'] / self.config['max_time']) * self.config['chart_height']
@@ -761,125 +1175,320 @@ class BenchmarkChart(BaseAnimation):
         comparison_text = Text(f"Assembly is {speedup:.1f}× faster than C!", font_size=28, color=GOLD)
         comparison_text.to_edge(DOWN)
 
+        optimization_note = Text("~2-2.5× faster from bit-packing and register operations",
+                                font_size=24, color=GREEN).to_edge(DOWN)
+
+        if self.config['static_fast']:
+            # Fade the finished chart in, then hold it as one frozen frame that
+            # manim rasterizes once and repeats, for as long as the build-up takes
+            chart = VGroup(axes, x_label, y_label, assembly_bar, assembly_label, assembly_value,
+                           c_bar, c_label, c_value, optimization_note)
+            fade_in_time = 1.0
+            self.play(FadeIn(chart), run_time=fade_in_time)
+            self.pause(sum(self._BUILD_UP_RUN_TIMES.values()) - fade_in_time)
+            self.cleanup_scene(title)
+            return
+
         # Animate chart creation
-        self.play(Create(axes), Write(x_label), Write(y_label))
+        run_times = self._BUILD_UP_RUN_TIMES
+        self.play(Create(axes), Write(x_label), Write(y_label), run_time=run_times['axes'])
 
         # Animate bars appearing
-        self.play(FadeIn(assembly_bar), run_time=1.0)
-        self.play(Write(assembly_label), Write(assembly_value))
+        self.play(FadeIn(assembly_bar), run_time=run_times['assembly_bar'])
+        self.play(Write(assembly_label), Write(assembly_value), run_time=run_times['assembly_labels'])
 
-        self.play(FadeIn(c_bar), run_time=1.0)
-        self.play(Write(c_label), Write(c_value))
+        self.play(FadeIn(c_bar), run_time=run_times['c_bar'])
+        self.play(Write(c_label), Write(c_value), run_time=run_times['c_labels'])
 
         # Show comparison
-        self.play(Write(comparison_text), run_time=2)
-        self.wait(2)
+        self.play(Write(comparison_text), run_time=run_times['comparison'])
+        self.wait(run_times['comparison_hold'])
 
         # Additional optimization note
-        optimization_note = Text("~2-2.5× faster from bit-packing and register operations",
-                                font_size=24, color=GREEN).to_edge(DOWN)
-        self.play(FadeOut(comparison_text), FadeIn(optimization_note), run_time=1.0)
-        self.wait(2)
+        self.play(FadeOut(comparison_text), FadeIn(optimization_note),
+                  run_time=run_times['optimization_note'])
+        self.wait(run_times['optimization_note_hold'])
 
         self.cleanup_scene(title)
 
 
+# Animations are registered as "module:ClassName" specs and only imported when used
+
+# Scene-based animations (don't inherit from BaseAnimation)
+_SCENE_ANIMATIONS = MappingProxyType({
+    'register_packing_visual': f'{__name__}:RegisterPackingVisual',
+})
+
+# BaseAnimation-based animations
+_BASE_ANIMATIONS = MappingProxyType({
+    'register_packing': f'{__name__}:RegisterPackingExecution',
+    'exact_match': f'{__name__}:ExactMatchExecution',
+    'elimination_loop': f'{__name__}:EliminationLoopExecution',
+    'entropy_reduction': f'{__name__}:EntropyReduction',
+    'stack_overwrite': f'{__name__}:StackOverwriteExecution',
+    'benchmark_chart': f'{__name__}:BenchmarkChart',
+})
+
+_ALL_ANIMATIONS = MappingProxyType({**_SCENE_ANIMATIONS, **_BASE_ANIMATIONS})
+ANIMATION_NAMES = tuple(_ALL_ANIMATIONS)
+
+# Render quality presets
+_QUALITY_SETTINGS = MappingProxyType({
+    'low': MappingProxyType({'pixel_height': 480, 'pixel_width': 854}),
+    'medium': MappingProxyType({'pixel_height': 720, 'pixel_width': 1280}),
+    'high': MappingProxyType({'pixel_height': 1080, 'pixel_width': 1920}),
+})
+
+# Resolution and frame rate per output target, used unless --quality is given.
+# x264 needs even dimensions, so the GIF target is 720x404 rather than 720x405
+_TARGET_SETTINGS = MappingProxyType({
+    'gif': MappingProxyType({'pixel_height': 404, 'pixel_width': 720, 'frame_rate': 15}),
+    'preview': MappingProxyType({'pixel_height': 480, 'pixel_width': 854, 'frame_rate': 24}),
+    'video': MappingProxyType({'pixel_height': 1080, 'pixel_width': 1920, 'frame_rate': 30}),
+})
+
+
+_RESOLVED_ANIMATIONS: Dict[str, type] = {}
+
+
+def _resolve_animation(animation_name: str) -> type:
+    """Import and return the class registered for an animation name."""
+    animation_class = _RESOLVED_ANIMATIONS.get(animation_name)
+    if animation_class is None:
+        module_name, class_name = _ALL_ANIMATIONS[animation_name].split(':')
+        animation_class = getattr(importlib.import_module(module_name), class_name)
+        _RESOLVED_ANIMATIONS[animation_name] = animation_class
+    return animation_class
+
+
 def create_animation(animation_name: str, config: Dict[str, Any] = None):
-    """Factory function to create animation instances."""
-    # Scene-based animations (don't inherit from BaseAnimation)
-    scene_animations = {
-        'register_packing_detailed': RegisterPackingDetailed,
-        'register_packing_accurate': RegisterPackingAccurate,
-        'register_packing_visual': RegisterPackingVisual,
-    }
-
-    # BaseAnimation-based animations
-    base_animations = {
-        'register_packing': RegisterPackingExecution,
-        'exact_match': ExactMatchExecution,
-        'elimination_loop': EliminationLoopExecution,
-        'entropy_reduction': EntropyReduction,
-        'stack_overwrite': StackOverwriteExecution,
-        'benchmark_chart': BenchmarkChart,
-    }
-
-    all_animations = {**scene_animations, **base_animations}
-
-    if animation_name not in all_animations:
-        raise ValueError(f"Unknown animation: {animation_name}. Available: {list(all_animations.keys())}")
-
-    animation_class = all_animations[animation_name]
-
-    # Scene-based animations don't take config parameter
-    if animation_name in scene_animations:
-        return animation_class()
-    else:
-        return animation_class(config)
+    """Factory function to create animation instances.
 
+    A scene can only be rendered once, so every call builds a fresh instance;
+    only the import of the animation class is cached.
+    """
+    if animation_name in _SCENE_ANIMATIONS:
+        # Scene-based animations don't take config parameter
+        return _resolve_animation(animation_name)()
+    if animation_name in _BASE_ANIMATIONS:
+        return _resolve_animation(animation_name)(config)
+    raise ValueError(f"Unknown animation: {animation_name}. Available: {list(ANIMATION_NAMES)}")
+
+
+def _drain(stream, sink) -> None:
+    """Copy a child process pipe to a sink line by line until it closes."""
+    for line in stream:
+        sink.write(line)
+    stream.close()
+
+
+def run_streaming(cmd: List[str], **kwargs) -> int:
+    """Run a command, streaming its stdout/stderr through instead of buffering them."""
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, bufsize=1, **kwargs)
+    drains = [threading.Thread(target=_drain, args=(proc.stdout, sys.stdout), daemon=True),
+              threading.Thread(target=_drain, args=(proc.stderr, sys.stderr), daemon=True)]
+    for drain in drains:
+        drain.start()
+    returncode = proc.wait()
+    for drain in drains:
+        drain.join()
+    return returncode
+
+
+@functools.lru_cache(maxsize=None)
+def _warmup() -> Path:
+    """Load fonts and LaTeX once per process and point manim at the shared Tex/Text caches.
+
+    Returns a manim config file that gives render subprocesses the same caches and settings.
+    """
+    for cache_dir in _SHARED_CACHE_CONFIG.values():
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
 
-def main():
-    """Main function to parse arguments and run animations."""
-    parser = argparse.ArgumentParser(description='Generate GIFs for Mastermind Assembly Blog')
-    parser.add_argument('animation', choices=[
-        'register_packing', 'exact_match', 'elimination_loop',
-        'entropy_reduction', 'stack_overwrite', 'benchmark_chart'
-    ], help='Which animation to generate')
-    parser.add_argument('--config', type=str, help='JSON config file path')
-    parser.add_argument('--output', type=str, default='media',
-                       help='Output directory for rendered files')
-    parser.add_argument('--format', choices=['gif', 'mp4'], default='gif',
-                       help='Output format')
-    parser.add_argument('--quality', choices=['low', 'medium', 'high'], default='high',
-                       help='Render quality')
+    with tempconfig(_SHARED_CACHE_CONFIG):
+        Text("warm", font="Monospace").get_bounding_box()
+        if shutil.which("latex"):
+            MathTex("x")
 
-    args = parser.parse_args()
+    # --custom_folders takes its directories from its own section, so set both
+    cache_options = "".join(f"{key} = {value}\n" for key, value in _SHARED_CACHE_CONFIG.items())
+    render_options = "".join(f"{key} = {value}\n" for key, value in _RENDER_CONFIG.items())
+    config_file = _SHARED_CACHE_DIR / "manim.cfg"
+    # Concurrent CLIs and workers share the file, so replace it whole rather than rewriting it
+    partial_file = config_file.with_suffix(f".{os.getpid()}.tmp")
+    partial_file.write_text(f"[CLI]\n{cache_options}{render_options}\n[custom_folders]\n{cache_options}")
+    os.replace(partial_file, config_file)
+    return config_file
+
+
+def count_animations(animation_name: str, animation_config: Dict[str, Any] = None) -> int:
+    """Count the animations (self.play/self.wait calls) of a scene without rendering any frame.
+
+    The dry run builds every Tex and Text of the scene, which also fills the shared caches.
+    """
+    with tempconfig({'dry_run': True, 'from_animation_number': sys.maxsize, **_SHARED_CACHE_CONFIG}):
+        animation = create_animation(animation_name, animation_config)
+        animation.render()
+        return animation.renderer.num_plays
+
+
+def render_sharded(cmd: List[str], class_name: str, output_name: str, output_dir: Path,
+                   format_type: str, num_animations: int, jobs: int, env: Dict[str, str]) -> int:
+    """Render disjoint animation ranges in parallel manim processes and stitch them with ffmpeg.
 
+    Each shard gets its own media directory, since manim keeps one partial movie
+    file list per scene and concurrent renders of the same scene would clobber it.
+    """
+    shard_size = math.ceil(num_animations / jobs)
+    shards = [(start, min(start + shard_size, num_animations) - 1)
+              for start in range(0, num_animations, shard_size)]
+    shard_root = output_dir / f"{output_name}_shards"
+
+    def render_shard(index: int, start: int, end: int) -> int:
+        shard_cmd = cmd + [
+            "--media_dir", str(shard_root / f"part{index}"),
+            "-n", f"{start},{end}",
+            "-o", output_name,
+            "animations.py", class_name,
+        ]
+        return run_streaming(shard_cmd, env=env, cwd=_SCRIPT_DIR)
+
+    print(f"Rendering {num_animations} animations in {len(shards)} shards...")
+    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        futures = {executor.submit(render_shard, i, start, end): i
+                   for i, (start, end) in enumerate(shards)}
+        for future in as_completed(futures):
+            returncode = future.result()
+            if returncode != 0:
+                print(f"Shard {futures[future]} failed with exit code: {returncode}")
+                return returncode
+
+    # Stitch the shards back together in animation order
+    concat_list = shard_root / "concat.txt"
+    concat_list.write_text("".join(
+        f"file '{(shard_root / f'part{i}' / f'{output_name}.{format_type}').resolve().as_posix()}'\n"
+        for i in range(len(shards))
+    ))
+    ffmpeg_cmd = ["ffmpeg", "-y", "-v", "error", "-f", "concat", "-safe", "0", "-i", str(concat_list)]
+    if format_type != 'gif':
+        # GIF frames can't be stream-copied across files, so only videos skip re-encoding
+        ffmpeg_cmd.extend(["-c", "copy"])
+    ffmpeg_cmd.append(str(output_dir / f"{output_name}.{format_type}"))
+
+    returncode = run_streaming(ffmpeg_cmd)
+    if returncode != 0:
+        print(f"Stitching shards failed with exit code: {returncode}")
+        return returncode
+
+    shutil.rmtree(shard_root)
+    return 0
+
+
+def read_config(path: Path, animation_class: type) -> Dict[str, Any]:
+    """Read a JSON config file, streaming large ones and keeping only the keys the class reads."""
+    if ijson is not None and path.stat().st_size > _STREAMED_CONFIG_SIZE:
+        # Scene-based animations don't take a config at all
+        required_keys = (animation_class.required_config_keys()
+                         if issubclass(animation_class, BaseAnimation) else frozenset())
+        with open(path, 'rb') as f:
+            return {key: value for key, value in ijson.kvitems(f, '', use_float=True)
+                    if key in required_keys}
+
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def load_config(config_path: str, animation_name: str) -> Dict[str, Any]:
+    """Load the JSON config file of an animation."""
+    return read_config(Path(config_path), _resolve_animation(animation_name))
+
+
+def gif_from_mp4(video_file: Path, gif_file: Path) -> int:
+    """Encode a GIF from a rendered video with a palette generated from its frames."""
+    palette_file = video_file.with_name(f"{video_file.stem}_palette.png")
+    returncode = run_streaming(["ffmpeg", "-y", "-v", "error", "-i", str(video_file),
+                                "-vf", "palettegen=stats_mode=full", str(palette_file)])
+    if returncode == 0:
+        returncode = run_streaming(["ffmpeg", "-y", "-v", "error", "-i", str(video_file),
+                                    "-i", str(palette_file), "-filter_complex", "paletteuse",
+                                    str(gif_file)])
+    palette_file.unlink(missing_ok=True)
+    if returncode == 0:
+        video_file.unlink()
+    return returncode
+
+
+def render_animation(animation_name: str, args: argparse.Namespace) -> int:
+    """Render one animation with the CLI options, returning a process exit code."""
     # Load config if provided
     config = {}
     if args.config:
-        with open(args.config, 'r') as f:
-            config = json.load(f)
+        config = load_config(args.config, animation_name)
 
-    # Set render quality
-    quality_settings = {
-        'low': {'pixel_height': 480, 'pixel_width': 854},
-        'medium': {'pixel_height': 720, 'pixel_width': 1280},
-        'high': {'pixel_height': 1080, 'pixel_width': 1920},
-    }
-
-    # Create animation instance
-    animation = create_animation(args.animation, config)
-
-    # Configure output
-    output_dir = Path(args.output)
+    # Configure output; manim runs from this file's directory, so use an absolute path
+    output_dir = Path(args.output).resolve()
     output_dir.mkdir(exist_ok=True)
 
-    # Render animation
-    scene_config = quality_settings[args.quality]
+    # Render animation at an explicit quality, or else at the resolution of the output target
+    if args.quality:
+        scene_config = dict(_QUALITY_SETTINGS[args.quality])
+        quality_config = {'quality': f"{args.quality}_quality"}
+        quality_label = args.quality
+    else:
+        target = args.target or ('gif' if args.format == 'gif' else 'video')
+        scene_config = dict(_TARGET_SETTINGS[target])
+        quality_config = dict(scene_config)
+        quality_label = f"{target} target, {scene_config['frame_rate']} fps"
     scene_config.update({
-        'output_file_path': str(output_dir / f"{args.animation}.{args.format}"),
+        'output_file_path': str(output_dir / f"{animation_name}.{args.format}"),
         'format': args.format,
     })
 
+    # Skip the render when the output was produced from identical inputs
+    expected_file = output_dir / f"{animation_name}.{args.format}"
+    cache_file = expected_file.with_suffix(expected_file.suffix + '.sha')
+    cache_key = hashlib.blake2b(json.dumps({
+        'animation': animation_name,
+        'quality': quality_config,
+        'format': args.format,
+        'config': config,
+    }, sort_keys=True).encode() + Path(__file__).read_bytes()).hexdigest()
+    if expected_file.exists() and cache_file.exists() and cache_file.read_text() == cache_key:
+        print(f"Cache hit, output is up to date: {expected_file}")
+        return 0
+
+    # Only a render that will actually happen pays for warming up
+    cache_config_file = _warmup()
+
     # Render the animation using manim command line
-    print(f"Rendering {args.animation} animation...")
+    print(f"Rendering {animation_name} animation...")
     print(f"Output: {scene_config['output_file_path']}")
-    print(f"Quality: {args.quality} ({scene_config['pixel_width']}x{scene_config['pixel_height']})")
+    print(f"Quality: {quality_label} ({scene_config['pixel_width']}x{scene_config['pixel_height']})")
 
-    import subprocess
-    import sys
-    import os
+    # GIFs are encoded from an mp4 render with a generated palette, which is faster and
+    # smaller than manim's GIF writer; a process handed over to manim can't post-process
+    handoff = args.isolated and not args.verify_output
+    render_format = 'mp4' if args.format == 'gif' and not handoff else args.format
+    # The intermediate gets its own name, so it never replaces a real mp4 render of this animation
+    render_name = animation_name if render_format == args.format else f"{animation_name}_gif_source"
+    render_file = output_dir / f"{render_name}.{render_format}"
 
     # Set environment variables for manim configuration
     env = os.environ.copy()
     env['MANIM_CONFIG_FILE'] = ''  # Don't use config file
+    if args.config:
+        # The manim CLI builds scenes without a config, so point the subprocesses at the file;
+        # its contents could exceed the size limit of a single environment variable
+        env[_CONFIG_ENV_VAR] = str(Path(args.config).resolve())
 
     # Build manim command
     cmd = [
         sys.executable, "-m", "manim",
-        "--format", args.format,
-        "--media_dir", str(output_dir),
+        "--format", render_format,
         "--custom_folders",
+        "--config_file", str(cache_config_file),
         "-v", "WARNING"  # Reduce verbosity
     ]
 
@@ -888,39 +1497,158 @@ def main():
         cmd.extend(["-ql"])
     elif args.quality == "medium":
         cmd.extend(["-qm"])
-    else:  # high
+    elif args.quality == "high":
         cmd.extend(["-qh"])
+    else:
+        cmd.extend(["-r", f"{scene_config['pixel_width']},{scene_config['pixel_height']}",
+                    "--fps", str(scene_config['frame_rate'])])
 
-    # Add the animation class and output name
-    cmd.extend(["animations.py", args.animation])
-
-    print(f"Running: {' '.join(cmd)}")
+    class_name = _ALL_ANIMATIONS[animation_name].split(':')[1]
+    jobs = max(1, args.jobs)
 
     try:
-        result = subprocess.run(cmd, env=env, cwd=Path(__file__).parent, capture_output=True, text=True)
-        if result.returncode == 0:
+        # Shard the render when asked to and there is more than one animation to split
+        num_animations = count_animations(animation_name, config) if jobs > 1 else 1
+        if min(jobs, num_animations) > 1:
+            returncode = render_sharded(cmd, class_name, render_name, output_dir, render_format,
+                                        num_animations, min(jobs, num_animations), env)
+        elif args.isolated:
+            # Add the output location, animation class and output name
+            cmd.extend(["--media_dir", str(output_dir), "-o", render_name, "animations.py", class_name])
+            print(f"Running: {' '.join(cmd)}")
+            if not args.verify_output:
+                # Nothing left to do afterwards, so let manim replace this process
+                sys.stdout.flush()
+                os.chdir(_SCRIPT_DIR)
+                os.execvpe(cmd[0], cmd, env)
+            returncode = run_streaming(cmd, env=env, cwd=_SCRIPT_DIR)
+        else:
+            # Render in this process; the scene has to be built after the config is applied
+            with tempconfig({
+                **quality_config,
+                'format': render_format,
+                'media_dir': str(output_dir),
+                'video_dir': str(output_dir),
+                'output_file': render_name,
+                'verbosity': 'WARNING',
+                **_SHARED_CACHE_CONFIG,
+                **_RENDER_CONFIG,
+            }):
+                create_animation(animation_name, config).render()
+            returncode = 0
+
+        if returncode == 0 and render_format != args.format:
+            returncode = gif_from_mp4(render_file, expected_file)
+
+        if returncode == 0:
             print("Animation rendering completed successfully!")
 
             # Check if the output file was created
-            expected_file = output_dir / f"{args.animation}.{args.format}"
             if expected_file.exists():
+                cache_file.write_text(cache_key)
                 print(f"Output file created: {expected_file}")
             else:
                 print(f"Warning: Expected output file not found: {expected_file}")
                 # List what files were actually created
                 print("Files in output directory:")
-                for file in output_dir.glob("*"):
-                    print(f"  {file.name}")
+                with os.scandir(output_dir) as entries:
+                    for entry in entries:
+                        print(f"  {entry.name}")
 
         else:
-            print(f"Animation rendering failed with exit code: {result.returncode}")
-            print("STDOUT:", result.stdout)
-            print("STDERR:", result.stderr)
+            print(f"Animation rendering failed with exit code: {returncode}")
             return 1
     except Exception as e:
         print(f"Animation rendering failed: {e}")
         return 1
 
+    return 0
+
+
+def serve() -> int:
+    """Render animations requested as JSON lines on stdin, answering each with a JSON line on stdout.
+
+    manim is imported once for the whole session, so every job only pays for its
+    own render. All other output, including the warmup's, is moved to stderr to
+    keep stdout for the replies.
+    """
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), 'w', buffering=1)
+    sys.stdout.flush()
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            animation_name = request['animation']
+            if animation_name not in _ALL_ANIMATIONS:
+                raise ValueError(f"Unknown animation: {animation_name}. Available: {list(ANIMATION_NAMES)}")
+            job_args = argparse.Namespace(
+                config=request.get('config'),
+                output=request.get('output', 'media'),
+                format=request.get('format', 'gif'),
+                quality=request.get('quality'),
+                target=request.get('target'),
+                jobs=1,
+                isolated=False,
+                verify_output=True,
+            )
+            returncode = render_animation(animation_name, job_args)
+        except Exception as e:
+            print(f"Animation rendering failed: {e}")
+            returncode = 1
+        replies.write(json.dumps({'returncode': returncode}) + "\n")
+    return 0
+
+
+def main():
+    """Main function to parse arguments and run animations."""
+    parser = argparse.ArgumentParser(description='Generate GIFs for Mastermind Assembly Blog')
+    parser.add_argument('animation', nargs='?', choices=ANIMATION_NAMES + ('all',),
+                       help="Which animation to generate, or 'all' to render every one in parallel")
+    parser.add_argument('--config', type=str, help='JSON config file path')
+    parser.add_argument('--output', type=str, default='media',
+                       help='Output directory for rendered files')
+    parser.add_argument('--format', choices=['gif', 'mp4'], default='gif',
+                       help='Output format')
+    parser.add_argument('--quality', choices=['low', 'medium', 'high'],
+                       help='Render quality; overrides the resolution picked by --target')
+    parser.add_argument('--target', choices=list(_TARGET_SETTINGS),
+                       help='What the output is for, which picks its resolution and frame rate '
+                            '(default: gif for --format gif, otherwise video)')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Number of parallel manim processes to shard the render across '
+                            '(default: 1, render without sharding)')
+    parser.add_argument('--isolated', action='store_true',
+                       help='Render a single-process job in a separate manim process')
+    parser.add_argument('--no-verify-output', dest='verify_output', action='store_false',
+                       help='With --isolated, hand the process over to manim instead of '
+                            'checking its output afterwards')
+    parser.add_argument('--serve', action='store_true',
+                       help='Run as a worker that renders JSON job lines from stdin, '
+                            'replying with one JSON result line per job')
+
+    args = parser.parse_args()
+    if args.animation is None and not args.serve:
+        parser.error("an animation is required unless --serve is given")
+
+    if args.serve:
+        return serve()
+
+    if args.animation != 'all':
+        return render_animation(args.animation, args)
+
+    # Scenes are independent, so render one per process; each renders on a single
+    # core and must return to the pool rather than hand its process over to manim
+    worker_args = argparse.Namespace(**{**vars(args), 'jobs': 1, 'verify_output': True})
+    with Pool(min(len(ANIMATION_NAMES), os.cpu_count() or 1)) as pool:
+        returncodes = pool.map(
+            functools.partial(render_animation, args=worker_args),
+            ANIMATION_NAMES,
+        )
+    return 1 if any(returncodes) else 0
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -6,83 +6,143 @@ Usage:
     python run_animation.py register_packing
     python run_animation.py exact_match --format gif --quality high
     python run_animation.py benchmark_chart --output ./gifs
+    python run_animation.py exact_match elimination_loop
+    python run_animation.py --all --format mp4
+    python run_animation.py --all --daemon
 """
 
-import subprocess
+import argparse
+import collections
+import json
+import queue
 import sys
 import os
 from pathlib import Path
+from types import MappingProxyType
+
+# manim is run from the script's own directory
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Map animation names to class names
+ANIMATION_TO_CLASS = MappingProxyType({
+    'register_packing': 'RegisterPackingExecution',
+    'register_packing_visual': 'RegisterPackingVisual',
+    'exact_match': 'ExactMatchExecution',
+    'elimination_loop': 'EliminationLoopExecution',
+    'entropy_reduction': 'EntropyReduction',
+    'stack_overwrite': 'StackOverwriteExecution',
+    'benchmark_chart': 'BenchmarkChart'
+})
+
+VALID_ANIMATIONS = frozenset(ANIMATION_TO_CLASS)
+
+# Map quality names to manim's quality flags
+_QUALITY_FLAGS = MappingProxyType({
+    'low': '-ql',
+    'medium': '-qm',
+    'high': '-qh'
+})
+
+# One-line descriptions shown when the script is run without arguments
+_ANIMATION_DESCRIPTIONS = MappingProxyType({
+    'register_packing': 'Register bit placement execution',
+    'register_packing_visual': 'Visual register packing with aligned legend',
+    'exact_match': 'Exact match calculation with bit operations',
+    'elimination_loop': 'Candidate elimination loop execution',
+    'entropy_reduction': 'Entropy reduction visualization',
+    'stack_overwrite': 'Stack overwrite execution for printf',
+    'benchmark_chart': 'Performance comparison chart'
+})
+
+_EXAMPLES = (
+    'python run_animation.py register_packing',
+    'python run_animation.py exact_match --format mp4 --quality low',
+    'python run_animation.py benchmark_chart --output ./exports',
+    'python run_animation.py --all --format mp4',
+    'python run_animation.py --all --daemon'
+)
+
+# The no-argument usage text never changes, so build it once and write it in one call
+_HELP_TEXT = (
+    f"{__doc__}\n"
+    "\nAvailable animations:\n"
+    + "".join(f"  {name} - {description}\n" for name, description in _ANIMATION_DESCRIPTIONS.items())
+    + "\nExamples:\n"
+    + "".join(f"  {example}\n" for example in _EXAMPLES)
+)
+
+_PARSER = argparse.ArgumentParser(description='Run an animation for the Mastermind Assembly Blog')
+_PARSER.add_argument('animation', nargs='*', metavar='animation',
+                     help=f"Which animations to render ({', '.join(ANIMATION_TO_CLASS)})")
+_PARSER.add_argument('--all', action='store_true', help='Render every animation')
+_PARSER.add_argument('--format', choices=['gif', 'mp4'], default='gif', help='Output format')
+_PARSER.add_argument('--quality', choices=_QUALITY_FLAGS, default='high',
+                     help='Render quality')
+_PARSER.add_argument('--output', default='media', help='Output directory for rendered files')
+_PARSER.add_argument('--config', help='JSON config file path')
+_PARSER.add_argument('--daemon', action='store_true',
+                     help='Render through long-lived animations.py workers that import manim once')
 
 def run_animation(animation_name: str, format_type: str = 'gif', quality: str = 'high',
                  output_dir: str = 'media', config_file: str = None):
     """Run a specific animation with given parameters."""
-
-    # Map animation names to class names
-    animation_to_class = {
-        'register_packing': 'RegisterPackingExecution',
-        'register_packing_detailed': 'RegisterPackingDetailed',
-        'register_packing_accurate': 'RegisterPackingAccurate',
-        'register_packing_visual': 'RegisterPackingVisual',
-        'exact_match': 'ExactMatchExecution',
-        'elimination_loop': 'EliminationLoopExecution',
-        'entropy_reduction': 'EntropyReduction',
-        'stack_overwrite': 'StackOverwriteExecution',
-        'benchmark_chart': 'BenchmarkChart'
-    }
+    # Imported here so the help and argument-error paths don't load it
+    import subprocess
 
     # Get the actual class name for manim
-    class_name = animation_to_class[animation_name]
+    class_name = ANIMATION_TO_CLASS[animation_name]
 
-    # Build manim command
-    cmd = [
+    # Build manim command; its shape is fixed once the arguments are known
+    cmd = (
         sys.executable, "-m", "manim",
         "--format", format_type,
         "--media_dir", output_dir,
         "--custom_folders",
-        "-v", "WARNING"  # Reduce verbosity
-    ]
-
-    # Add quality settings
-    if quality == "low":
-        cmd.extend(["-ql"])
-    elif quality == "medium":
-        cmd.extend(["-qm"])
-    else:  # high
-        cmd.extend(["-qh"])
-
-    # Add the animation class
-    cmd.extend(["animations.py", class_name])
+        "-v", "WARNING",  # Reduce verbosity
+        _QUALITY_FLAGS.get(quality, "-qh"),
+        "animations.py", class_name
+    )
 
     print(f"Running: {' '.join(cmd)}")
 
+    returncode = 1
     try:
-        result = subprocess.run(cmd, cwd=Path(__file__).parent, capture_output=True, text=True)
+        # manim already logs at WARNING, so drop stdout and keep only the end of stderr
+        proc = subprocess.Popen(cmd, cwd=_SCRIPT_DIR, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True)
+        stderr_tail = collections.deque(maxlen=20)
+        for line in proc.stderr:
+            stderr_tail.append(line)
+        returncode = proc.wait()
 
-        if result.returncode == 0:
+        if returncode == 0:
             print("Animation rendering completed successfully!")
 
-            # Check for the output file (manim usually names it after the class)
-            expected_files = [
-                Path(output_dir) / f"{class_name}.{format_type}",
-                Path(output_dir) / f"{animation_name}.{format_type}"
-            ]
+            # List the output directory once; every lookup below works on that listing
+            output_path = Path(output_dir)
+            suffix = f".{format_type}"
+            try:
+                with os.scandir(output_path) as it:
+                    entries = {e.name: e for e in it if e.is_file(follow_symlinks=False)}
+            except FileNotFoundError:
+                entries = {}
 
+            # Check for the output file (manim usually names it after the class)
             found_file = None
-            for expected_file in expected_files:
-                if expected_file.exists():
-                    found_file = expected_file
+            for name in (f"{class_name}{suffix}", f"{animation_name}{suffix}"):
+                if name in entries:
+                    found_file = output_path / name
                     break
 
             if found_file:
                 print(f"SUCCESS: Animation saved to: {found_file}")
             else:
-                # Look for manim-generated files and rename them
-                output_path = Path(output_dir)
-                if output_path.exists():
-                    # Look for files that match the class name pattern
-                    for file in output_path.glob(f"{class_name}*.{format_type}"):
-                        user_friendly_name = output_path / f"{animation_name}.{format_type}"
-                        file.rename(user_friendly_name)
+                # Look for manim-generated files that match the class name pattern and rename them
+                for name, entry in entries.items():
+                    if name.startswith(class_name) and name.endswith(suffix):
+                        user_friendly_name = output_path / f"{animation_name}{suffix}"
+                        # os.replace also overwrites an existing file on Windows
+                        os.replace(entry.path, os.fspath(user_friendly_name))
                         print(f"SUCCESS: Animation saved to: {user_friendly_name}")
                         found_file = user_friendly_name
                         break
@@ -90,98 +150,127 @@ def run_animation(animation_name: str, format_type: str = 'gif', quality: str =
                 if not found_file:
                     print(f"Warning: Expected output file not found")
                     print("Files in output directory:")
-                    for file in output_path.glob("*"):
-                        if file.is_file():
-                            print(f"  {file.name}")
+                    for name in entries:
+                        print(f"  {name}")
         else:
-            print(f"ERROR: Animation rendering failed with exit code: {result.returncode}")
-            print("STDOUT:", result.stdout[-500:])  # Last 500 chars
-            if result.stderr:
-                print("STDERR:", result.stderr[-500:])  # Last 500 chars
+            print(f"ERROR: Animation rendering failed with exit code: {returncode}")
+            if stderr_tail:
+                print("STDERR:", ''.join(stderr_tail))  # Last 20 lines
 
     except Exception as e:
         print(f"ERROR: Animation rendering failed: {e}")
 
-    return result.returncode if 'result' in locals() else 1
+    return returncode
+
+def start_worker():
+    """Start an animations.py worker that renders jobs sent to it over stdin."""
+    import subprocess
+    return subprocess.Popen((sys.executable, "-u", "animations.py", "--serve"), cwd=_SCRIPT_DIR,
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1)
+
+def run_in_worker(worker, animation_name: str, format_type: str = 'gif', quality: str = 'high',
+                  output_dir: str = 'media', config_file: str = None):
+    """Render an animation in a running worker and return its exit code."""
+
+    # The worker runs from the script directory, so send it absolute paths
+    request = {
+        "animation": animation_name,
+        "format": format_type,
+        "quality": quality,
+        "output": str(Path(output_dir).resolve()),
+        "config": str(Path(config_file).resolve()) if config_file else None,
+    }
+    print(f"Rendering {animation_name} in worker {worker.pid}")
+
+    try:
+        worker.stdin.write(json.dumps(request) + "\n")
+        worker.stdin.flush()
+        # Replies are JSON objects; pass through anything else that reached the pipe
+        while True:
+            reply = worker.stdout.readline()
+            if not reply:
+                print(f"ERROR: Worker {worker.pid} exited while rendering {animation_name}")
+                return 1
+            try:
+                returncode = json.loads(reply)["returncode"]
+                break
+            except (ValueError, TypeError, KeyError):
+                sys.stderr.write(reply)
+    except OSError as e:
+        print(f"ERROR: Animation rendering failed: {e}")
+        return 1
+
+    if returncode == 0:
+        print(f"SUCCESS: Animation saved to: {Path(output_dir) / f'{animation_name}.{format_type}'}")
+    else:
+        print(f"ERROR: Animation rendering failed with exit code: {returncode}")
+    return returncode
 
 def main():
     """Main function to handle command line arguments."""
     if len(sys.argv) < 2:
-        print(__doc__)
-        print("\nAvailable animations:")
-        animations = [
-            'register_packing - Register bit placement execution',
-            'register_packing_detailed - Detailed register packing with visual bytes',
-            'register_packing_accurate - Accurate register packing with bit rotation',
-            'register_packing_visual - Visual register packing with aligned legend',
-            'exact_match - Exact match calculation with bit operations',
-            'elimination_loop - Candidate elimination loop execution',
-            'entropy_reduction - Entropy reduction visualization',
-            'stack_overwrite - Stack overwrite execution for printf',
-            'benchmark_chart - Performance comparison chart'
-        ]
-        for anim in animations:
-            print(f"  {anim}")
-        print("\nExamples:")
-        print("  python run_animation.py register_packing")
-        print("  python run_animation.py exact_match --format mp4 --quality low")
-        print("  python run_animation.py benchmark_chart --output ./exports")
+        sys.stdout.write(_HELP_TEXT)
         return
 
-    animation_name = sys.argv[1]
-
-    # Parse additional arguments
-    format_type = 'gif'
-    quality = 'high'
-    output_dir = 'media'
-    config_file = None
-
-    i = 2
-    while i < len(sys.argv):
-        arg = sys.argv[i]
-        if arg == '--format' and i + 1 < len(sys.argv):
-            format_type = sys.argv[i + 1]
-            i += 2
-        elif arg == '--quality' and i + 1 < len(sys.argv):
-            quality = sys.argv[i + 1]
-            i += 2
-        elif arg == '--output' and i + 1 < len(sys.argv):
-            output_dir = sys.argv[i + 1]
-            i += 2
-        elif arg == '--config' and i + 1 < len(sys.argv):
-            config_file = sys.argv[i + 1]
-            i += 2
-        else:
-            i += 1
-
-    # Validate animation name and map to class names
-    animation_to_class = {
-        'register_packing': 'RegisterPackingExecution',
-        'register_packing_detailed': 'RegisterPackingDetailed',
-        'register_packing_accurate': 'RegisterPackingAccurate',
-        'register_packing_visual': 'RegisterPackingVisual',
-        'exact_match': 'ExactMatchExecution',
-        'elimination_loop': 'EliminationLoopExecution',
-        'entropy_reduction': 'EntropyReduction',
-        'stack_overwrite': 'StackOverwriteExecution',
-        'benchmark_chart': 'BenchmarkChart'
-    }
+    # Unknown options are rejected by the parser, unknown animations here
+    args = _PARSER.parse_args()
+    names = list(ANIMATION_TO_CLASS) if args.all else list(dict.fromkeys(args.animation))
+    if not names:
+        _PARSER.error("no animation given (name one or more, or pass --all)")
+    unknown = [name for name in names if name not in VALID_ANIMATIONS]
+    if unknown:
+        _PARSER.error(f"unknown animation(s): {', '.join(unknown)} "
+                      f"(choose from {', '.join(ANIMATION_TO_CLASS)})")
 
-    valid_animations = list(animation_to_class.keys())
+    # Create output directory if it doesn't exist; a stat is cheaper than a redundant mkdir
+    output_path = Path(args.output)
+    if not output_path.is_dir():
+        output_path.mkdir(parents=True, exist_ok=True)
 
-    if animation_name not in valid_animations:
-        print(f"ERROR: Unknown animation: {animation_name}")
-        print(f"Available: {', '.join(valid_animations)}")
-        return 1
+    # Run the animation
+    num_workers = min(len(names), os.cpu_count() or 1)
+    if args.daemon:
+        # Keep a pool of manim-importing workers and hand each job to whichever is idle
+        workers = [start_worker() for _ in range(num_workers)]
+        idle = queue.Queue()
+        for worker in workers:
+            idle.put(worker)
 
-    # Get the actual class name for manim
-    class_name = animation_to_class[animation_name]
+        def render(name):
+            worker = idle.get()
+            try:
+                return run_in_worker(worker, name, args.format, args.quality, args.output, args.config)
+            finally:
+                idle.put(worker)
+    else:
+        def render(name):
+            return run_animation(name, args.format, args.quality, args.output, args.config)
 
-    # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    try:
+        if len(names) == 1:
+            return render(names[0])
 
-    # Run the animation
-    return run_animation(animation_name, format_type, quality, output_dir, config_file)
+        # Each render is its own manim process, so threads are enough to keep every core busy;
+        # a new render starts as soon as any earlier one finishes
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        failed = []
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = {executor.submit(render, name): name for name in names}
+            for future in as_completed(futures):
+                if future.result() != 0:
+                    failed.append(futures[future])
+    finally:
+        if args.daemon:
+            for worker in workers:
+                worker.stdin.close()
+            for worker in workers:
+                worker.wait()
+
+    if failed:
+        print(f"ERROR: {len(failed)} of {len(names)} animations failed: {', '.join(sorted(failed))}")
+        return 1
+    print(f"All {len(names)} animations rendered successfully!")
+    return 0
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file